@@ -7,12 +7,40 @@ Date: April 4, 2023
 Provides functions to perform conjecture checking (battery tests) in an easy way. 
 """
 
-from typing import Generator, Callable
-from tqdm import tqdm
+from typing import Generator, Callable, Iterable, Optional, Union
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from functools import partial, lru_cache
+from itertools import islice
 from math import inf
+from types import FunctionType
+import inspect
+import pickle
+import weakref
+import numpy as np
 
 
-def find_counterexample(n: int, condition: Callable[[object], bool], generator: Generator[object, None, None], show_progress: bool = False) -> object:
+# Number of batches in which every checking is split
+UPDATE_RATIO = 100
+
+# Maximum number of objects pulled at once from a generator
+PULL_SIZE = 4096
+
+# Default size of the caches used by memoized checkings
+MEMOIZE_SIZE = 65536
+
+# Cache statistics of the last memoized checking, see cache_info
+_last_cache_info = {}
+
+# Numba kernel of the indexed checkings, built on first use (False if numba is not available)
+_njit_kernel = None
+
+# Numba compiled versions of the callables given to the indexed checkings, dropped along with them
+_jit_functions = weakref.WeakKeyDictionary()
+
+
+def find_counterexample(n: int, condition: Callable[[object], bool], generator: Union[Generator[object, None, None], Callable[[int, int], np.ndarray]], show_progress: bool = False, vectorized: bool = False, parallel: int = 1, memoize: Union[bool, int] = False) -> object:
     """
     Performs several checks of a conjecture over some objects and returns the first one, the first 
     found counterexample, not satisfying it.
@@ -23,10 +51,20 @@ def find_counterexample(n: int, condition: Callable[[object], bool], generator:
         Number of checkings to perform.
     condition: Callable[[object], boolean]
         The conjecture to check.
-    generator: Generator[object, None, None]
-        A generator that yields objects for which to check the conjecture. 
-    progress_bar: boolean, optional 
+    generator: Generator[object, None, None] or Callable[[int, int], np.ndarray]
+        A generator that yields objects for which to check the conjecture, or a source that
+        returns the objects with indices in [lo, hi) when called as generator(lo, hi).
+    show_progress: boolean, optional 
         A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition works over whole blocks of objects. The blocks
+        pulled from a generator are converted with numpy.asarray (default is False)
+    parallel: int, optional
+        Number of processes among which the batches are distributed. Requires generator to be a
+        source and every function to be picklable (default is 1)
+    memoize: boolean or int, optional
+        A flag used to cache the results of condition with functools.lru_cache,
+        or the size of that cache (MEMOIZE_SIZE if True). Requires hashable objects (default is False)
     
     Returns
     -------
@@ -34,62 +72,25 @@ def find_counterexample(n: int, condition: Callable[[object], bool], generator:
         An object representing the first counterexample found. If no one is found, returns None.
     """
 
-    # Local function: compute batch
-    def compute_batch(length):
-        for i in range(length):
-            current_object = next(generator)
+    condition, _ = _memoize(memoize, vectorized, parallel, condition)
 
-            # Check if the condition holds for the current object
-            if (not condition(current_object)):
-                return current_object
-        
-        return None
+    if _is_source(generator, parallel):
+        compute_batch = partial(_find_in_source, generator, condition, vectorized)
+    else:
+        compute_batch = partial(_find_in_generator, generator, condition, vectorized)
 
     # Print heading
-    print("  ________________________________")
-    print("  Find counterexample", n, "times")
-    print("  - Generator:", generator.__name__) 
-    print("  - Condition:", condition.__name__)
-    print("  ________________________________")
-    print("")
-
-    # Prepare batch length
-    UPDATE_RATIO = 100
-    progress_bar = tqdm(range(n), leave=False)
-
-    batch_length = n // UPDATE_RATIO   
-    remaining_length = n % UPDATE_RATIO
-
-    listOfBatches = [ (batch_length + 1) for i in range(remaining_length) ] + [(batch_length) for i in range(UPDATE_RATIO-remaining_length)]
-
-    # Loop of checkings
-    for batch in listOfBatches:
-        current_result = compute_batch(batch)        
-
-        # Update progress bar
-        progress_bar.update(batch)
-
-        # Check if checking is done
-        if current_result is not None:
-            # Close the progress bar
-            progress_bar.close()
-
-            # Print an end message
-            print("  Result: found counterexample!")
-            print("  -->", str(current_result))
+    _print_header("Find counterexample", n, [("Generator", _name_of(generator)), ("Condition", _name_of(condition))])
 
-            return current_result
+    result = _run(n, _map_batches(compute_batch, _batch_sizes(n), parallel), _FirstFalseReducer(), show_progress)
 
-    # Close the progress bar
-    progress_bar.close()
+    if memoize:
+        _save_cache_info(condition)
 
-    # Print a no concluding message
-    print("  Result: no concluding.")
+    return result
 
-    return None 
 
-
-def count_counterexamples(n: int, condition: Callable[[object], bool], generator: Generator[object, None, None], show_progress: bool = False) -> int:
+def count_counterexamples(n: int, condition: Callable[[object], bool], generator: Union[Generator[object, None, None], Callable[[int, int], np.ndarray]], show_progress: bool = False, vectorized: bool = False, parallel: int = 1, memoize: Union[bool, int] = False) -> int:
     """
     Counts the number of objects given by the generator within n iterations that do not satisfy the given
     condition (counts the number of counterxamples).
@@ -100,10 +101,20 @@ def count_counterexamples(n: int, condition: Callable[[object], bool], generator
         Number of checkings to perform.
     condition: Callable[[object], boolean]
         The conjecture to check.
-    generator: Generator[object, None, None]
-        A generator that yields objects for which to check the conjecture. 
-    progress_bar: boolean, optional 
+    generator: Generator[object, None, None] or Callable[[int, int], np.ndarray]
+        A generator that yields objects for which to check the conjecture, or a source that
+        returns the objects with indices in [lo, hi) when called as generator(lo, hi).
+    show_progress: boolean, optional 
         A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition works over whole blocks of objects. The blocks
+        pulled from a generator are converted with numpy.asarray (default is False)
+    parallel: int, optional
+        Number of processes among which the batches are distributed. Requires generator to be a
+        source and every function to be picklable (default is 1)
+    memoize: boolean or int, optional
+        A flag used to cache the results of condition with functools.lru_cache,
+        or the size of that cache (MEMOIZE_SIZE if True). Requires hashable objects (default is False)
     
     Returns
     -------
@@ -111,55 +122,82 @@ def count_counterexamples(n: int, condition: Callable[[object], bool], generator
         The number of counterexamples found.
     """
 
-    # Local function: compute batch
-    def compute_batch(length):
-        local_count = 0
-
-        for i in range(length):
-            current_object = next(generator)
+    condition, _ = _memoize(memoize, vectorized, parallel, condition)
 
-            # Check if the condition holds for the current object
-            if (not condition(current_object)):
-                local_count += 1
+    if _is_source(generator, parallel):
+        compute_batch = partial(_count_in_source, generator, condition, vectorized)
+    else:
+        compute_batch = partial(_count_in_generator, generator, condition, vectorized)
 
-        return local_count
-        
     # Print heading
-    print("  ________________________________")
-    print("  Count counterexamples", n, "times")
-    print("  - Generator:", generator.__name__) 
-    print("  - Condition:", condition.__name__)
-    print("  ________________________________")
-    print("")
+    _print_header("Count counterexamples", n, [("Generator", _name_of(generator)), ("Condition", _name_of(condition))])
 
-    # Prepare batch length
-    UPDATE_RATIO = 100
-    progress_bar = tqdm(range(n), leave=False)
+    result = _run(n, _map_batches(compute_batch, _batch_sizes(n), parallel), _CountReducer(), show_progress)
 
-    batch_length = n // UPDATE_RATIO   
-    remaining_length = n % UPDATE_RATIO
+    if memoize:
+        _save_cache_info(condition)
 
-    listOfBatches = [ (batch_length + 1) for i in range(remaining_length) ] + [(batch_length) for i in range(UPDATE_RATIO-remaining_length)]
+    return result
 
-    # Count counterexamples
-    number_of_counterexamples = 0
 
-    # Loop of checkings
-    for batch in listOfBatches:
-        number_of_counterexamples += compute_batch(batch)
+def smallest_counterexample(n: int, condition: Callable[[object], bool], generator: Union[Generator[object, None, None], Callable[[int, int], np.ndarray]], get_object_weight: Callable[[object], int], show_progress: bool = False, vectorized: bool = False, parallel: int = 1, memoize: Union[bool, int] = False, bound: Optional[int] = None) -> object:
+    """
+    Finds the smallest object, in terms of the getObjectWeight function, that does not satisfies the conjecture
+    given by the condition function.
+
+    Parameters
+    ---------- 
+    n: int
+        Number of checkings to perform.
+    condition: Callable[[object], boolean]
+        The conjecture to check.
+    generator: Generator[object, None, None] or Callable[[int, int], np.ndarray]
+        A generator that yields objects for which to check the conjecture, or a source that
+        returns the objects with indices in [lo, hi) when called as generator(lo, hi).
+    getObjectWeight: Callable[[object], int]
+        A function that gives the weight of an object by returning an int.
+    show_progress: boolean, optional 
+        A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition and getObjectWeight work over whole blocks of objects.
+        The blocks pulled from a generator are converted with numpy.asarray (default is False)
+    parallel: int, optional
+        Number of processes among which the batches are distributed. Requires generator to be a
+        source and every function to be picklable (default is 1)
+    memoize: boolean or int, optional
+        A flag used to cache the results of condition and getObjectWeight with functools.lru_cache,
+        or the size of that cache (MEMOIZE_SIZE if True). Requires hashable objects (default is False)
+    bound: int, optional
+        A known lower bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
+    
+    Returns
+    -------
+    object
+        The counterexample with the smallest weight between the computed ones.
+    """
+
+    condition, get_object_weight = _memoize(memoize, vectorized, parallel, condition, get_object_weight)
+
+    if _is_source(generator, parallel):
+        compute_batch = partial(_smallest_in_source, generator, condition, get_object_weight, vectorized)
+    else:
+        compute_batch = partial(_smallest_in_generator, generator, condition, get_object_weight, vectorized)
+
+    # Print heading
+    _print_header("Find the smallest", n, [("Generator", _name_of(generator)), ("Condition", _name_of(condition)), ("Weight", _name_of(get_object_weight))])
 
-        # Update the progress bar
-        progress_bar.update(batch)
+    result = _run(n, _map_batches(compute_batch, _batch_sizes(n), parallel), _ArgMinReducer(bound), show_progress)
 
-    # Print an end message
-    print("  Result:", number_of_counterexamples, "counterexamples found!")
+    if memoize:
+        _save_cache_info(condition, get_object_weight)
 
-    return number_of_counterexamples 
+    return result
 
 
-def smallest_counterexample(n: int, condition: Callable[[object], bool], generator: Generator[object, None, None], get_object_weight: Callable[[object], int], show_progress: bool = False) -> object:
+def greatest_counterexample(n: int, condition: Callable[[object], bool], generator: Union[Generator[object, None, None], Callable[[int, int], np.ndarray]], get_object_weight: Callable[[object], int], show_progress: bool = False, vectorized: bool = False, parallel: int = 1, memoize: Union[bool, int] = False, bound: Optional[int] = None) -> object:
     """
-    Finds the smallest object, in terms of the getObjectWeight function, that does not satisfies the conjecture
+    Finds the greatest object, in terms of the getObjectWeight function, that does not satisfies the conjecture
     given by the condition function.
 
     Parameters
@@ -168,160 +206,1091 @@ def smallest_counterexample(n: int, condition: Callable[[object], bool], generat
         Number of checkings to perform.
     condition: Callable[[object], boolean]
         The conjecture to check.
-    generator: Generator[object, None, None]
-        A generator that yields objects for which to check the conjecture. 
+    generator: Generator[object, None, None] or Callable[[int, int], np.ndarray]
+        A generator that yields objects for which to check the conjecture, or a source that
+        returns the objects with indices in [lo, hi) when called as generator(lo, hi).
     getObjectWeight: Callable[[object], int]
         A function that gives the weight of an object by returning an int.
-    progress_bar: boolean, optional 
+    show_progress: boolean, optional 
         A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition and getObjectWeight work over whole blocks of objects.
+        The blocks pulled from a generator are converted with numpy.asarray (default is False)
+    parallel: int, optional
+        Number of processes among which the batches are distributed. Requires generator to be a
+        source and every function to be picklable (default is 1)
+    memoize: boolean or int, optional
+        A flag used to cache the results of condition and getObjectWeight with functools.lru_cache,
+        or the size of that cache (MEMOIZE_SIZE if True). Requires hashable objects (default is False)
+    bound: int, optional
+        A known upper bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
     
     Returns
     -------
     object
-        The counterexample with the smallest weight between the computed ones.
+        The counterexample with the greatest weight between the computed ones.
     """
 
-    # Local function: compute batch
-    def compute_batch(length):
-        local_smallest_counterexample = None
-        local_smallest_weight = int("inf")
+    condition, get_object_weight = _memoize(memoize, vectorized, parallel, condition, get_object_weight)
 
-        for i in range(length):
-            current_object = next(generator)
+    if _is_source(generator, parallel):
+        compute_batch = partial(_greatest_in_source, generator, condition, get_object_weight, vectorized)
+    else:
+        compute_batch = partial(_greatest_in_generator, generator, condition, get_object_weight, vectorized)
 
-            # Check if the condition holds for the current object
-            if (not condition(current_object)):
-                current_weight = get_object_weight(current_object)
-                if (current_weight < local_smallest_weight):
-                    local_smallest_counterexample = current_object
-                    local_smallest_weight = current_weight
+    # Print heading
+    _print_header("Find the greatest", n, [("Generator", _name_of(generator)), ("Condition", _name_of(condition)), ("Weight", _name_of(get_object_weight))])
 
-        return (local_smallest_counterexample, local_smallest_weight)
+    result = _run(n, _map_batches(compute_batch, _batch_sizes(n), parallel), _ArgMaxReducer(bound), show_progress)
+
+    if memoize:
+        _save_cache_info(condition, get_object_weight)
+
+    return result
+
+
+def cache_info() -> dict:
+    """
+    Returns the cache statistics of the last checking performed with memoize enabled.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping "condition", and "weight" if it was used, to the CacheInfo of its
+        functools.lru_cache (hits, misses, maxsize and currsize).
+    """
+
+    return dict(_last_cache_info)
+
+
+def _memoize(memoize: Union[bool, int], vectorized: bool, parallel: int, condition: Callable[[object], bool], get_object_weight: Callable[[object], int] = None) -> tuple:
+    """
+    Wraps condition and get_object_weight with functools.lru_cache if memoize is set. Raises
+    ValueError if memoize is asked for a vectorized or parallel checking.
+    """
+
+    if not memoize:
+        return (condition, get_object_weight)
+
+    if vectorized:
+        raise ValueError("memoize requires a non vectorized checking")
+
+    if parallel > 1:
+        raise ValueError("memoize is not supported by parallel checkings")
+
+    maxsize = MEMOIZE_SIZE if memoize is True else memoize
+
+    condition = lru_cache(maxsize=maxsize)(condition)
+
+    if get_object_weight is not None:
+        get_object_weight = lru_cache(maxsize=maxsize)(get_object_weight)
+
+    return (condition, get_object_weight)
+
+
+def _save_cache_info(condition: Callable[[object], bool], get_object_weight: Callable[[object], int] = None) -> None:
+    """
+    Keeps a snapshot of the cache statistics of the memoized condition and get_object_weight once the
+    checking is done, so that the caches themselves, and the objects they hold, can be released.
+    """
+
+    global _last_cache_info
+
+    cache_info = {"condition": condition.cache_info()}
+
+    if get_object_weight is not None:
+        cache_info["weight"] = get_object_weight.cache_info()
+
+    _last_cache_info = cache_info
+
+
+def _print_header(name: str, n: int, details: list, mode: str = None) -> None:
+    """
+    Prints the heading of a checking. The details are (label, value) pairs printed under the title.
+    """
 
-    # Print heading
     print("  ________________________________")
-    print("  Find the smallest", n, "times")
-    print("  - Generator:", generator.__name__) 
-    print("  - Condition:", condition.__name__)
-    print("  - Weight:   ", get_object_weight.__name__)
+    if mode is None:
+        print("  " + name, n, "times")
+    else:
+        print("  " + name, n, "times", "(" + mode + ")")
+
+    for label, value in details:
+        print("  - " + (label + ":").ljust(10), value)
+
     print("  ________________________________")
     print("")
 
-    # Prepare batch length
-    UPDATE_RATIO = 100
-    progress_bar = tqdm(range(n), leave=False)
 
-    batch_length = n // UPDATE_RATIO   
-    remaining_length = n % UPDATE_RATIO
+def _name_of(function: object) -> str:
+    """
+    Returns the name printed in the heading for a function, generator or callable object.
+    """
 
-    listOfBatches = [ (batch_length + 1) for i in range(remaining_length) ] + [(batch_length) for i in range(UPDATE_RATIO-remaining_length)]
+    return getattr(function, "__name__", type(function).__name__)
 
-    # Lowest counterexample
-    smallest_counterexample = None
-    smallest_weight = int("inf")
 
-    # Loop of checkings
-    for batch in listOfBatches:
-        local_smallest_counterexample, local_smallest_weight = compute_batch(batch)
+def _batch_sizes(n: int, update_ratio: int = UPDATE_RATIO) -> Generator[int, None, None]:
+    """
+    Yields the lengths of the update_ratio batches in which n checkings are split. The first
+    n % update_ratio batches are one unit longer than the rest.
+    """
+
+    batch_length, remaining_length = divmod(n, update_ratio)
+
+    for i in range(update_ratio):
+        yield batch_length + (1 if i < remaining_length else 0)
+
+
+class _Reducer(ABC):
+    """
+    Combines the results of the batches of a checking. The state is set up by init, every batch
+    result is folded by update and the final result is printed and returned by done. Once
+    short_circuit is set, the remaining batches are skipped.
+    """
+
+    short_circuit = False
+
+    def init(self) -> None:
+        self.short_circuit = False
+
+    @abstractmethod
+    def update(self, batch_result: object) -> None:
+        pass
+
+    @abstractmethod
+    def done(self) -> object:
+        pass
+
+
+class _FirstFalseReducer(_Reducer):
+    """
+    Keeps the first counterexample found. Batch results are a counterexample or None.
+    """
+
+    def init(self) -> None:
+        super().init()
+        self.counterexample = None
+
+    def update(self, batch_result: object) -> None:
+        if batch_result is not None:
+            self.counterexample = batch_result
+            self.short_circuit = True
+
+    def done(self) -> object:
+        if self.counterexample is not None:
+            # Print an end message
+            print("  Result: found counterexample!")
+            print("  -->", str(self.counterexample))
+        else:
+            # Print a no concluding message
+            print("  Result: no concluding.")
+
+        return self.counterexample
+
+
+class _CountReducer(_Reducer):
+    """
+    Adds up the number of counterexamples of every batch.
+    """
+
+    def init(self) -> None:
+        super().init()
+        self.number_of_counterexamples = 0
+
+    def update(self, batch_result: int) -> None:
+        self.number_of_counterexamples += batch_result
+
+    def done(self) -> int:
+        # Print an end message
+        print("  Result:", self.number_of_counterexamples, "counterexamples found!")
+
+        return self.number_of_counterexamples
+
+
+class _ArgMinReducer(_Reducer):
+    """
+    Keeps the counterexample with the smallest weight. Batch results are (counterexample, weight)
+    pairs and ties are broken in favour of the first one. If a lower bound of the weights is given,
+    the checking short circuits as soon as it is reached.
+    """
+
+    def __init__(self, bound: Optional[int] = None) -> None:
+        self.bound = bound
+
+    def init(self) -> None:
+        super().init()
+        self.counterexample = None
+        self.weight = inf
+
+    def update(self, batch_result: tuple) -> None:
+        counterexample, weight = batch_result
+
+        if (weight < self.weight):
+            self.counterexample = counterexample
+            self.weight = weight
+
+            # No counterexample can improve the current one
+            if (self.bound is not None and self.weight <= self.bound):
+                self.short_circuit = True
+
+    def done(self) -> object:
+        # Print a message
+        if (self.counterexample is None):
+            print("  Result:", "no counterexample found.")
+        else:
+            print("  Result: lowest counterexample")
+            print("  -->", str(self.counterexample))
+
+        return self.counterexample
+
+
+class _ArgMaxReducer(_Reducer):
+    """
+    Keeps the counterexample with the greatest weight. Batch results are (counterexample, weight)
+    pairs and ties are broken in favour of the first one. If an upper bound of the weights is given,
+    the checking short circuits as soon as it is reached.
+    """
+
+    def __init__(self, bound: Optional[int] = None) -> None:
+        self.bound = bound
+
+    def init(self) -> None:
+        super().init()
+        self.counterexample = None
+        self.weight = -inf
+
+    def update(self, batch_result: tuple) -> None:
+        counterexample, weight = batch_result
+
+        if (weight > self.weight):
+            self.counterexample = counterexample
+            self.weight = weight
+
+            # No counterexample can improve the current one
+            if (self.bound is not None and self.weight >= self.bound):
+                self.short_circuit = True
+
+    def done(self) -> object:
+        # Print a message
+        if (self.counterexample is None):
+            print("  Result:", "no counterexample found.")
+        else:
+            print("  Result: greatest counterexample")
+            print("  -->", str(self.counterexample))
+
+        return self.counterexample
+
+
+class _NullBar:
+    """
+    Stand-in for the progress bar when show_progress is not set, so that no tqdm bar is built
+    nor updated.
+    """
 
-        if (local_smallest_weight < smallest_weight):
-            smallest_counterexample = local_smallest_counterexample
-            smallest_weight = local_smallest_weight
+    def update(self, n: int) -> None:
+        pass
 
-        # Update the progress bar
-        progress_bar.update(batch)
+    def close(self) -> None:
+        pass
 
-    # Print a message
-    if (smallest_counterexample is None):
-        print("  Result:", "no counterexample found.")
+
+def _run(n: int, batches: Generator[tuple, None, None], reducer: _Reducer, show_progress: bool) -> object:
+    """
+    Main loop shared by every checking. Folds the (length, result) pairs yielded by batches into
+    the reducer while updating the progress bar, if show_progress is set, and returns the reducer's
+    final result.
+    """
+
+    reducer.init()
+
+    # Prepare progress bar
+    if show_progress:
+        # Imported here so that tqdm is only loaded when a progress bar is shown
+        from tqdm import tqdm
+
+        progress_bar = tqdm(total=n, leave=False, mininterval=0.25)
     else:
-        print("  Result: lowest counterexample")
-        print("  -->", str(smallest_counterexample))
+        progress_bar = _NullBar()
+
+    # Bind to locals, faster to look up inside the loop
+    reducer_update = reducer.update
+    pb_update = progress_bar.update
+
+    # Loop of checkings
+    for batch, batch_result in batches:
+        reducer_update(batch_result)
+
+        # Update progress bar
+        pb_update(batch)
+
+        # Check if checking is done
+        if reducer.short_circuit:
+            break
+
+    # Stop the pending batches, if any
+    batches.close()
+
+    # Close the progress bar
+    progress_bar.close()
 
-    return smallest_counterexample 
+    return reducer.done()
 
 
-def greatest_counterexample(n: int, condition: Callable[[object], bool], generator: Generator[object, None, None], get_object_weight: Callable[[object], int], show_progress: bool = False) -> object:
+def _is_source(generator: Union[Generator[object, None, None], Callable[[int, int], np.ndarray]], parallel: int) -> bool:
     """
-    Finds the greatest object, in terms of the getObjectWeight function, that does not satisfies the conjecture
-    given by the condition function.
+    Tells whether generator is an indexable source, called as generator(lo, hi), rather than a
+    Python generator. Raises TypeError if it is neither a callable source nor an iterator, and
+    ValueError if a parallel checking is asked over a generator.
+    """
+
+    is_source = callable(generator)
+
+    if not is_source and not hasattr(generator, "__next__"):
+        raise TypeError("generator must be an iterator or a callable source(lo, hi), not " + type(generator).__name__)
+
+    if parallel > 1 and not is_source:
+        raise ValueError("parallel checking requires an indexable source")
+
+    return is_source
+
+
+def _pull_blocks(generator: Generator[object, None, None], length: int, vectorized: bool) -> Generator[Union[list, np.ndarray], None, None]:
+    """
+    Yields the next length objects of the generator in blocks of at most PULL_SIZE, as numpy arrays
+    if vectorized is set and as lists otherwise, so that a batch is never held in memory at once.
+    Raises ValueError if the generator runs out of objects.
+    """
+
+    while (length > 0):
+        block_length = min(length, PULL_SIZE)
+        block = list(islice(generator, block_length))
+
+        if len(block) < block_length:
+            raise ValueError("the generator ran out of objects before the n checkings were performed")
+
+        length -= block_length
+
+        yield np.asarray(block) if vectorized else block
+
+
+def _find_in_generator(generator: Generator[object, None, None], condition: Callable[[object], bool], vectorized: bool, lo: int, hi: int) -> object:
+    """
+    Returns the first counterexample between the next hi-lo objects of the generator, or None if
+    there is no one.
+    """
+
+    for block in _pull_blocks(generator, hi - lo, vectorized):
+        counterexample = _find_in_block(condition, vectorized, block)
+
+        # Leave the rest of the batch in the generator, it will not be checked
+        if counterexample is not None:
+            return counterexample
+
+    return None
+
+
+def _count_in_generator(generator: Generator[object, None, None], condition: Callable[[object], bool], vectorized: bool, lo: int, hi: int) -> int:
+    """
+    Returns the number of counterexamples between the next hi-lo objects of the generator.
+    """
+
+    return sum(_count_in_block(condition, vectorized, block) for block in _pull_blocks(generator, hi - lo, vectorized))
+
+
+def _smallest_in_generator(generator: Generator[object, None, None], condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, lo: int, hi: int) -> tuple:
+    """
+    Returns the smallest counterexample between the next hi-lo objects of the generator along with
+    its weight.
+    """
+
+    local_smallest_counterexample = None
+    local_smallest_weight = inf
+
+    for block in _pull_blocks(generator, hi - lo, vectorized):
+        counterexample, weight = _smallest_in_block(condition, get_object_weight, vectorized, block)
+        if (weight < local_smallest_weight):
+            local_smallest_counterexample, local_smallest_weight = counterexample, weight
+
+    return (local_smallest_counterexample, local_smallest_weight)
+
+
+def _greatest_in_generator(generator: Generator[object, None, None], condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, lo: int, hi: int) -> tuple:
+    """
+    Returns the greatest counterexample between the next hi-lo objects of the generator along with
+    its weight.
+    """
+
+    local_greatest_counterexample = None
+    local_greatest_weight = -inf
+
+    for block in _pull_blocks(generator, hi - lo, vectorized):
+        counterexample, weight = _greatest_in_block(condition, get_object_weight, vectorized, block)
+        if (weight > local_greatest_weight):
+            local_greatest_counterexample, local_greatest_weight = counterexample, weight
+
+    return (local_greatest_counterexample, local_greatest_weight)
+
+
+def _find_in_block(condition: Callable[[object], bool], vectorized: bool, block: Union[list, np.ndarray]) -> object:
+    """
+    Returns the first counterexample of the block, or None if there is no one.
+    """
+
+    if vectorized:
+        mask = condition(block)
+
+        # Only the position of the first False is needed, not every one of them
+        if mask.all():
+            return None
+
+        return block[int(np.argmax(~mask))]
+
+    for current_object in block:
+        # Check if the condition holds for the current object
+        if (not condition(current_object)):
+            return current_object
+
+    return None
+
+
+def _count_in_block(condition: Callable[[object], bool], vectorized: bool, block: Union[list, np.ndarray]) -> int:
+    """
+    Returns the number of counterexamples of the block.
+    """
+
+    if vectorized:
+        return len(block) - int(np.count_nonzero(condition(block)))
+
+    local_count = 0
+    for current_object in block:
+        # Check if the condition holds for the current object
+        if (not condition(current_object)):
+            local_count += 1
+
+    return local_count
+
+
+def _smallest_in_block(condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, block: Union[list, np.ndarray]) -> tuple:
+    """
+    Returns the smallest counterexample of the block along with its weight.
+    """
+
+    local_smallest_counterexample = None
+    local_smallest_weight = inf
+
+    if vectorized:
+        bad_idx = np.flatnonzero(~condition(block))
+
+        # A single argmin scan instead of a data-dependent branch per object
+        if bad_idx.size:
+            weights = get_object_weight(block[bad_idx])
+            idx = weights.argmin()
+            local_smallest_counterexample = block[bad_idx[idx]]
+            local_smallest_weight = weights[idx]
+
+        return (local_smallest_counterexample, local_smallest_weight)
+
+    for current_object in block:
+        # Check if the condition holds for the current object
+        if (not condition(current_object)):
+            current_weight = get_object_weight(current_object)
+            if (current_weight < local_smallest_weight):
+                local_smallest_counterexample, local_smallest_weight = current_object, current_weight
+
+    return (local_smallest_counterexample, local_smallest_weight)
+
+
+def _greatest_in_block(condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, block: Union[list, np.ndarray]) -> tuple:
+    """
+    Returns the greatest counterexample of the block along with its weight.
+    """
+
+    local_greatest_counterexample = None
+    local_greatest_weight = -inf
+
+    if vectorized:
+        bad_idx = np.flatnonzero(~condition(block))
+
+        # A single argmax scan instead of a data-dependent branch per object
+        if bad_idx.size:
+            weights = get_object_weight(block[bad_idx])
+            idx = weights.argmax()
+            local_greatest_counterexample = block[bad_idx[idx]]
+            local_greatest_weight = weights[idx]
+
+        return (local_greatest_counterexample, local_greatest_weight)
+
+    for current_object in block:
+        # Check if the condition holds for the current object
+        if (not condition(current_object)):
+            current_weight = get_object_weight(current_object)
+            if (current_weight > local_greatest_weight):
+                local_greatest_counterexample, local_greatest_weight = current_object, current_weight
+
+    return (local_greatest_counterexample, local_greatest_weight)
+
+
+def _find_in_source(source: Callable[[int, int], np.ndarray], condition: Callable[[object], bool], vectorized: bool, lo: int, hi: int) -> object:
+    """
+    Returns the first counterexample between the objects source(lo, hi), or None if there is no one.
+    """
+
+    return _find_in_block(condition, vectorized, source(lo, hi))
+
+
+def _count_in_source(source: Callable[[int, int], np.ndarray], condition: Callable[[object], bool], vectorized: bool, lo: int, hi: int) -> int:
+    """
+    Returns the number of counterexamples between the objects source(lo, hi).
+    """
+
+    return _count_in_block(condition, vectorized, source(lo, hi))
+
+
+def _smallest_in_source(source: Callable[[int, int], np.ndarray], condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, lo: int, hi: int) -> tuple:
+    """
+    Returns the smallest counterexample between the objects source(lo, hi) along with its weight.
+    """
+
+    return _smallest_in_block(condition, get_object_weight, vectorized, source(lo, hi))
+
+
+def _greatest_in_source(source: Callable[[int, int], np.ndarray], condition: Callable[[object], bool], get_object_weight: Callable[[object], int], vectorized: bool, lo: int, hi: int) -> tuple:
+    """
+    Returns the greatest counterexample between the objects source(lo, hi) along with its weight.
+    """
+
+    return _greatest_in_block(condition, get_object_weight, vectorized, source(lo, hi))
+
+
+def _batch_ranges(batch_sizes: Iterable[int]) -> Generator[tuple, None, None]:
+    """
+    Yields the index range [lo, hi) of each batch, given the lengths of the batches.
+    """
+
+    lo = 0
+    for batch in batch_sizes:
+        yield (lo, lo + batch)
+        lo += batch
+
+
+def _map_batches(compute_batch: Callable[[int, int], object], batch_sizes: Iterable[int], parallel: int) -> Generator[tuple, None, None]:
+    """
+    Yields the length and the result of each batch, in order. When parallel > 1, the batches are
+    computed by a pool of processes, keeping only a few of them submitted ahead, and the pending
+    ones are cancelled without waiting for them once the caller stops. Raises TypeError if
+    compute_batch cannot be pickled.
+    """
+
+    if parallel <= 1:
+        lo = 0
+        for batch in batch_sizes:
+            yield (batch, compute_batch(lo, lo + batch))
+            lo += batch
+        return
+
+    # A batch failing to pickle inside the pool leaves the interpreter hanging at exit, so fail early
+    try:
+        pickle.dumps(compute_batch)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise TypeError("parallel checkings require picklable functions (module-level, not lambdas or local functions)") from error
+
+    ranges = _batch_ranges(batch_sizes)
+
+    executor = ProcessPoolExecutor(max_workers=parallel)
+    try:
+        # Batches submitted ahead, two per process so that none of them idles between batches
+        pending = deque()
+        for lo, hi in islice(ranges, 2 * parallel):
+            pending.append((hi - lo, executor.submit(compute_batch, lo, hi)))
+
+        while pending:
+            batch, future = pending.popleft()
+
+            for lo, hi in islice(ranges, 1):
+                pending.append((hi - lo, executor.submit(compute_batch, lo, hi)))
+
+            yield (batch, future.result())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _map_chunks(compute_chunk: Callable[[np.ndarray], object], array_generator: Generator[np.ndarray, None, None], n: int, batch_size: int) -> Generator[tuple, None, None]:
+    """
+    Yields the length and the result of each chunk given by array_generator, until n objects are
+    computed. The last chunk is truncated if needed. Raises ValueError if a chunk is shorter than
+    batch_size or the generator runs out of chunks before that.
+    """
+
+    remaining_length = n
+
+    # Bind to locals, faster to look up inside the loop
+    gen_next = array_generator.__next__
+
+    while (remaining_length > 0):
+        try:
+            chunk = gen_next()[:remaining_length]
+        except StopIteration:
+            raise ValueError("the generator ran out of objects before the n checkings were performed") from None
+
+        if (len(chunk) < min(batch_size, remaining_length)):
+            raise ValueError(f"the generator yielded a chunk of {len(chunk)} objects, expected {batch_size}")
+
+        remaining_length -= len(chunk)
+
+        yield (len(chunk), compute_chunk(chunk))
+
+
+def _vectorize(function: Callable[[object], object], vectorized: bool, dtype: type = object) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Returns a version of function that accepts a whole chunk of objects. If the function is already
+    vectorized it is returned as it is, otherwise it is wrapped with numpy.frompyfunc and its
+    results are casted to dtype.
+    """
+
+    if vectorized:
+        return function
+
+    ufunc = np.frompyfunc(function, 1, 1)
+
+    return lambda chunk: ufunc(chunk).astype(dtype)
+
+
+def find_counterexample_vec(n: int, condition_vec: Callable[[np.ndarray], np.ndarray], array_generator: Generator[np.ndarray, None, None], batch_size: int, show_progress: bool = False, vectorized: bool = True) -> object:
+    """
+    Vectorized version of find_counterexample. The generator yields chunks of objects as numpy
+    arrays and the condition is evaluated over a whole chunk at once.
 
     Parameters
-    ---------- 
+    ----------
     n: int
         Number of checkings to perform.
-    condition: Callable[[object], boolean]
-        The conjecture to check.
-    generator: Generator[object, None, None]
-        A generator that yields objects for which to check the conjecture. 
-    getObjectWeight: Callable[[object], int]
-        A function that gives the weight of an object by returning an int.
-    progress_bar: boolean, optional 
+    condition_vec: Callable[[np.ndarray], np.ndarray]
+        The conjecture to check. Receives a chunk of objects and returns a boolean mask.
+    array_generator: Generator[np.ndarray, None, None]
+        A generator that yields chunks of batch_size objects for which to check the conjecture.
+    batch_size: int
+        Number of objects in each chunk yielded by the generator.
+    show_progress: boolean, optional
         A flag used to print a progress bar (default is False)
-    
+    vectorized: boolean, optional
+        A flag telling whether condition_vec works over chunks. If False, it is treated as a
+        scalar function and wrapped with numpy.frompyfunc (default is True)
+
+    Returns
+    -------
+    object
+        An object representing the first counterexample found. If no one is found, returns None.
+    """
+
+    # Print heading
+    _print_header("Find counterexample", n, [("Generator", _name_of(array_generator)), ("Condition", _name_of(condition_vec))], "vectorized")
+
+    compute_chunk = partial(_find_in_block, _vectorize(condition_vec, vectorized, bool), True)
+
+    return _run(n, _map_chunks(compute_chunk, array_generator, n, batch_size), _FirstFalseReducer(), show_progress)
+
+
+def count_counterexamples_vec(n: int, condition_vec: Callable[[np.ndarray], np.ndarray], array_generator: Generator[np.ndarray, None, None], batch_size: int, show_progress: bool = False, vectorized: bool = True) -> int:
+    """
+    Vectorized version of count_counterexamples. The generator yields chunks of objects as numpy
+    arrays and the condition is evaluated over a whole chunk at once.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition_vec: Callable[[np.ndarray], np.ndarray]
+        The conjecture to check. Receives a chunk of objects and returns a boolean mask.
+    array_generator: Generator[np.ndarray, None, None]
+        A generator that yields chunks of batch_size objects for which to check the conjecture.
+    batch_size: int
+        Number of objects in each chunk yielded by the generator.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition_vec works over chunks. If False, it is treated as a
+        scalar function and wrapped with numpy.frompyfunc (default is True)
+
+    Returns
+    -------
+    int
+        The number of counterexamples found.
+    """
+
+    # Print heading
+    _print_header("Count counterexamples", n, [("Generator", _name_of(array_generator)), ("Condition", _name_of(condition_vec))], "vectorized")
+
+    compute_chunk = partial(_count_in_block, _vectorize(condition_vec, vectorized, bool), True)
+
+    return _run(n, _map_chunks(compute_chunk, array_generator, n, batch_size), _CountReducer(), show_progress)
+
+
+def smallest_counterexample_vec(n: int, condition_vec: Callable[[np.ndarray], np.ndarray], array_generator: Generator[np.ndarray, None, None], weight_vec: Callable[[np.ndarray], np.ndarray], batch_size: int, show_progress: bool = False, vectorized: bool = True, bound: Optional[int] = None) -> object:
+    """
+    Vectorized version of smallest_counterexample. The generator yields chunks of objects as numpy
+    arrays and both the condition and the weight are evaluated over a whole chunk at once.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition_vec: Callable[[np.ndarray], np.ndarray]
+        The conjecture to check. Receives a chunk of objects and returns a boolean mask.
+    array_generator: Generator[np.ndarray, None, None]
+        A generator that yields chunks of batch_size objects for which to check the conjecture.
+    weight_vec: Callable[[np.ndarray], np.ndarray]
+        A function that receives a chunk of objects and returns the array of their weights.
+    batch_size: int
+        Number of objects in each chunk yielded by the generator.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition_vec and weight_vec work over chunks. If False, they are
+        treated as scalar functions and wrapped with numpy.frompyfunc (default is True)
+    bound: int, optional
+        A known lower bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
+
+    Returns
+    -------
+    object
+        The counterexample with the smallest weight between the computed ones.
+    """
+
+    # Print heading
+    _print_header("Find the smallest", n, [("Generator", _name_of(array_generator)), ("Condition", _name_of(condition_vec)), ("Weight", _name_of(weight_vec))], "vectorized")
+
+    compute_chunk = partial(_smallest_in_block, _vectorize(condition_vec, vectorized, bool), _vectorize(weight_vec, vectorized), True)
+
+    return _run(n, _map_chunks(compute_chunk, array_generator, n, batch_size), _ArgMinReducer(bound), show_progress)
+
+
+def greatest_counterexample_vec(n: int, condition_vec: Callable[[np.ndarray], np.ndarray], array_generator: Generator[np.ndarray, None, None], weight_vec: Callable[[np.ndarray], np.ndarray], batch_size: int, show_progress: bool = False, vectorized: bool = True, bound: Optional[int] = None) -> object:
+    """
+    Vectorized version of greatest_counterexample. The generator yields chunks of objects as numpy
+    arrays and both the condition and the weight are evaluated over a whole chunk at once.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition_vec: Callable[[np.ndarray], np.ndarray]
+        The conjecture to check. Receives a chunk of objects and returns a boolean mask.
+    array_generator: Generator[np.ndarray, None, None]
+        A generator that yields chunks of batch_size objects for which to check the conjecture.
+    weight_vec: Callable[[np.ndarray], np.ndarray]
+        A function that receives a chunk of objects and returns the array of their weights.
+    batch_size: int
+        Number of objects in each chunk yielded by the generator.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    vectorized: boolean, optional
+        A flag telling whether condition_vec and weight_vec work over chunks. If False, they are
+        treated as scalar functions and wrapped with numpy.frompyfunc (default is True)
+    bound: int, optional
+        A known upper bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
+
     Returns
     -------
     object
         The counterexample with the greatest weight between the computed ones.
     """
 
-    # Local function: compute batch
-    def compute_batch(length):
-        local_greatest_counterexample = None
-        local_greatest_weight = int("-inf")
+    # Print heading
+    _print_header("Find the greatest", n, [("Generator", _name_of(array_generator)), ("Condition", _name_of(condition_vec)), ("Weight", _name_of(weight_vec))], "vectorized")
+
+    compute_chunk = partial(_greatest_in_block, _vectorize(condition_vec, vectorized, bool), _vectorize(weight_vec, vectorized), True)
 
-        for i in range(length):
-            current_object = next(generator)
+    return _run(n, _map_chunks(compute_chunk, array_generator, n, batch_size), _ArgMaxReducer(bound), show_progress)
 
-            # Check if the condition holds for the current object
-            if (not condition(current_object)):
-                current_weight = get_object_weight(current_object)
-                if (current_weight > local_greatest_weight):
-                    local_greatest_counterexample = current_object
-                    local_greatest_weight = current_weight
 
-        return (local_greatest_counterexample, local_greatest_weight)
-        
+def _zero_weight(index: int) -> int:
+    """
+    Weight used by the indexed kernel when the checking does not need any weight.
+    """
+
+    return 0
+
+
+def _compute_batch_indexed(length: int, cond: Callable[[int], bool], weight: Callable[[int], int], sign: int, start_index: int, stop_at_first: bool) -> tuple:
+    """
+    Checks the condition over the indices start_index, ..., start_index+length-1. Returns the number of
+    counterexamples, the first of them and the one minimizing sign*weight along with that value. Indices
+    may be negative, so the last three values are only meaningful when the count is positive. If
+    stop_at_first is set, the loop stops right after the first counterexample.
+    """
+
+    count = 0
+    first_index = 0
+    best_index = 0
+    best_weight = inf
+
+    for i in range(start_index, start_index + length):
+        # Check if the condition holds for the current index
+        if (not cond(i)):
+            count += 1
+
+            if (count == 1):
+                first_index = i
+
+                if stop_at_first:
+                    break
+
+            current_weight = sign * weight(i)
+            if (count == 1 or current_weight < best_weight):
+                best_index = i
+                best_weight = current_weight
+
+    return (count, first_index, best_index, best_weight)
+
+
+def _get_njit_kernel() -> Optional[Callable]:
+    """
+    Imports numba and wraps _compute_batch_indexed with njit the first time an indexed checking runs,
+    so that importing this module does not load numba. Returns None if numba is not available.
+    """
+
+    global _njit_kernel
+
+    if _njit_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _njit_kernel = False
+        else:
+            _njit_kernel = njit(_compute_batch_indexed)
+
+    return _njit_kernel or None
+
+
+def _jit_function(function: Callable) -> Optional[Callable]:
+    """
+    Returns the numba compiled version of function, or None if it is not a plain Python function.
+    The compiled versions are kept while function is alive so that the kernel is not specialized
+    again for the same callable.
+    """
+
+    # Already compiled by the user
+    if hasattr(function, "py_func"):
+        return function
+
+    if not inspect.isfunction(function):
+        return None
+
+    jit_function = _jit_functions.get(function)
+
+    if jit_function is None:
+        from numba import njit
+
+        # Compile a copy, the compiled version would keep function alive otherwise
+        jit_function = njit(FunctionType(function.__code__, function.__globals__, function.__name__, function.__defaults__, function.__closure__))
+        _jit_functions[function] = jit_function
+
+    return jit_function
+
+
+def _indexed_kernel(condition: Callable[[int], bool], get_object_weight: Callable[[int], int]) -> tuple:
+    """
+    Chooses the function used to compute each batch of an indexed checking. Returns the numba kernel
+    along with the compiled callables when numba is available and both condition and get_object_weight
+    can be compiled in nopython mode. Otherwise, returns the pure Python version of the kernel.
+    """
+
+    kernel = _get_njit_kernel()
+
+    if kernel is not None:
+        from numba.core.errors import NumbaError
+
+        jit_condition = _jit_function(condition)
+        jit_weight = _jit_function(get_object_weight)
+
+        if jit_condition is not None and jit_weight is not None:
+            try:
+                # Compile ahead with an empty batch so that typing errors show up here
+                kernel(0, jit_condition, jit_weight, 1, 0, False)
+
+                return (kernel, jit_condition, jit_weight)
+            except (NumbaError, TypeError):
+                pass
+
+    return (_compute_batch_indexed, condition, get_object_weight)
+
+
+def _find_in_indices(kernel: Callable, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], start: int, lo: int, hi: int) -> int:
+    """
+    Returns the first counterexample between the indices start+lo, ..., start+hi-1, or None if there is no one.
+    """
+
+    count, first_index, _, _ = kernel(hi - lo, condition, get_object_weight, 1, start + lo, True)
+
+    return first_index if count > 0 else None
+
+
+def _count_in_indices(kernel: Callable, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], start: int, lo: int, hi: int) -> int:
+    """
+    Returns the number of counterexamples between the indices start+lo, ..., start+hi-1.
+    """
+
+    count, _, _, _ = kernel(hi - lo, condition, get_object_weight, 1, start + lo, False)
+
+    return count
+
+
+def _smallest_in_indices(kernel: Callable, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], start: int, lo: int, hi: int) -> tuple:
+    """
+    Returns the smallest counterexample between the indices start+lo, ..., start+hi-1 along with its weight.
+    """
+
+    count, _, best_index, best_weight = kernel(hi - lo, condition, get_object_weight, 1, start + lo, False)
+
+    return (best_index if count > 0 else None, best_weight)
+
+
+def _greatest_in_indices(kernel: Callable, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], start: int, lo: int, hi: int) -> tuple:
+    """
+    Returns the greatest counterexample between the indices start+lo, ..., start+hi-1 along with its weight.
+    """
+
+    # The kernel minimizes -weight, so its weight has to be negated back
+    count, _, best_index, best_weight = kernel(hi - lo, condition, get_object_weight, -1, start + lo, False)
+
+    return (best_index if count > 0 else None, -best_weight)
+
+
+def find_counterexample_jit(n: int, condition: Callable[[int], bool], show_progress: bool = False, start: int = 0) -> int:
+    """
+    Indexed version of find_counterexample. The objects are the integers start, ..., start+n-1 and
+    the loop over each batch is compiled with numba when available. The condition should be a
+    numeric function compatible with numba's nopython mode, otherwise the pure Python loop is used.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition: Callable[[int], boolean]
+        The conjecture to check. Receives the index of the object.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    start: int, optional
+        The first index to check, which may be negative (default is 0)
+
+    Returns
+    -------
+    int
+        The index of the first counterexample found. If no one is found, returns None.
+    """
+
     # Print heading
-    print("  ________________________________")
-    print("  Find the greatest", n, "times")
-    print("  - Generator:", generator.__name__) 
-    print("  - Condition:", condition.__name__)
-    print("  - Weight:   ", get_object_weight.__name__)
-    print("  ________________________________")
-    print("")
+    _print_header("Find counterexample", n, [("Indices", str(start) + " to " + str(start + n - 1)), ("Condition", _name_of(condition))], "jit")
+
+    compute_batch = partial(_find_in_indices, *_indexed_kernel(condition, _zero_weight), start)
 
-    # Prepare batch length
-    UPDATE_RATIO = 100
-    progress_bar = tqdm(range(n), leave=False)
+    return _run(n, _map_batches(compute_batch, _batch_sizes(n), 1), _FirstFalseReducer(), show_progress)
 
-    batch_length = n // UPDATE_RATIO   
-    remaining_length = n % UPDATE_RATIO
 
-    listOfBatches = [ (batch_length + 1) for i in range(remaining_length) ] + [(batch_length) for i in range(UPDATE_RATIO-remaining_length)]
+def count_counterexamples_jit(n: int, condition: Callable[[int], bool], show_progress: bool = False, start: int = 0) -> int:
+    """
+    Indexed version of count_counterexamples. The objects are the integers start, ..., start+n-1 and
+    the loop over each batch is compiled with numba when available. The condition should be a
+    numeric function compatible with numba's nopython mode, otherwise the pure Python loop is used.
 
-    # Greatest counterexample
-    greatest_counterexample = None
-    greatest_weight = int("-inf")
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition: Callable[[int], boolean]
+        The conjecture to check. Receives the index of the object.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    start: int, optional
+        The first index to check, which may be negative (default is 0)
 
-    # Loop of checkings
-    for batch in listOfBatches:
-        local_greatest_counterexample, local_greatest_weight = compute_batch(batch)
+    Returns
+    -------
+    int
+        The number of counterexamples found.
+    """
 
-        if (local_greatest_weight > greatest_weight):
-            greatest_counterexample = local_greatest_counterexample
-            greatest_weight = local_greatest_weight
+    # Print heading
+    _print_header("Count counterexamples", n, [("Indices", str(start) + " to " + str(start + n - 1)), ("Condition", _name_of(condition))], "jit")
 
-        # Update progress bar
-        progress_bar.update(batch)
+    compute_batch = partial(_count_in_indices, *_indexed_kernel(condition, _zero_weight), start)
+
+    return _run(n, _map_batches(compute_batch, _batch_sizes(n), 1), _CountReducer(), show_progress)
 
-    # Print a message
-    if (greatest_counterexample is None):
-        print("  Result:", "no counterexample found.")
-    else:
-        print("  Result: greatest counterexample")
-        print("  -->", str(greatest_counterexample))
 
-    return greatest_counterexample 
+def smallest_counterexample_jit(n: int, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], show_progress: bool = False, start: int = 0, bound: Optional[int] = None) -> int:
+    """
+    Indexed version of smallest_counterexample. The objects are the integers start, ..., start+n-1 and
+    the loop over each batch is compiled with numba when available. Both condition and get_object_weight
+    should be numeric functions compatible with numba's nopython mode, otherwise the pure Python loop
+    is used.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition: Callable[[int], boolean]
+        The conjecture to check. Receives the index of the object.
+    get_object_weight: Callable[[int], int]
+        A function that gives the weight of the object with the given index.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    start: int, optional
+        The first index to check, which may be negative (default is 0)
+    bound: int, optional
+        A known lower bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
+
+    Returns
+    -------
+    int
+        The index of the counterexample with the smallest weight between the computed ones.
+    """
+
+    # Print heading
+    _print_header("Find the smallest", n, [("Indices", str(start) + " to " + str(start + n - 1)), ("Condition", _name_of(condition)), ("Weight", _name_of(get_object_weight))], "jit")
+
+    compute_batch = partial(_smallest_in_indices, *_indexed_kernel(condition, get_object_weight), start)
+
+    return _run(n, _map_batches(compute_batch, _batch_sizes(n), 1), _ArgMinReducer(bound), show_progress)
+
+
+def greatest_counterexample_jit(n: int, condition: Callable[[int], bool], get_object_weight: Callable[[int], int], show_progress: bool = False, start: int = 0, bound: Optional[int] = None) -> int:
+    """
+    Indexed version of greatest_counterexample. The objects are the integers start, ..., start+n-1 and
+    the loop over each batch is compiled with numba when available. Both condition and get_object_weight
+    should be numeric functions compatible with numba's nopython mode, otherwise the pure Python loop
+    is used.
+
+    Parameters
+    ----------
+    n: int
+        Number of checkings to perform.
+    condition: Callable[[int], boolean]
+        The conjecture to check. Receives the index of the object.
+    get_object_weight: Callable[[int], int]
+        A function that gives the weight of the object with the given index.
+    show_progress: boolean, optional
+        A flag used to print a progress bar (default is False)
+    start: int, optional
+        The first index to check, which may be negative (default is 0)
+    bound: int, optional
+        A known upper bound of the weights. Once a counterexample reaching it is found, the
+        remaining batches are skipped and the first such counterexample is returned (default is None)
+
+    Returns
+    -------
+    int
+        The index of the counterexample with the greatest weight between the computed ones.
+    """
+
+    # Print heading
+    _print_header("Find the greatest", n, [("Indices", str(start) + " to " + str(start + n - 1)), ("Condition", _name_of(condition)), ("Weight", _name_of(get_object_weight))], "jit")
 
+    compute_batch = partial(_greatest_in_indices, *_indexed_kernel(condition, get_object_weight), start)
 
+    return _run(n, _map_batches(compute_batch, _batch_sizes(n), 1), _ArgMaxReducer(bound), show_progress)
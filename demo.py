@@ -1,12 +1,12 @@
 
 import time
+import numpy as np
 import conjecturing as ct
 
 
-# Generator 
-def sequence_generator(n):
-    for i in range(n):
-        yield i
+# Source
+def sequence_source(lo, hi):
+    return np.arange(lo, hi)
 
 # Condition
 def sleep_condition(x):
@@ -16,4 +16,4 @@ def sleep_condition(x):
 
 # ConjeTuring: testing the package
 n = 100001
-ct.find_counterexample(n, sleep_condition, sequence_generator(n), True)
+ct.find_counterexample(n, sleep_condition, sequence_source, True)